@@ -5,8 +5,8 @@ from steamy_py import Steam
 
 async def main():
     """The example shows obtaining a family group of user,
-    authorized by access_token of that user."""
-    async with Steam(access_token="YOUR_ACCESS_TOKEN") as steam:
+    authorized by access_token of that user, and the owners of its shared apps."""
+    async with Steam(api_key="YOUR_API_KEY", access_token="YOUR_ACCESS_TOKEN") as steam:
         family = await steam.family.get_family_group_for_user()
         family_groupid = family.response.family_groupid
         print(f"Family Group ID: {family_groupid}")
@@ -18,6 +18,15 @@ async def main():
         )
         print(f"Shared apps: {len(shared_library_apps.response.apps)}")
 
+        users: set[str] = set()
+        for app in shared_library_apps.response.apps:
+            users.update(app.owner_steamids)
+
+        idx = 0
+        async for user in steam.player.iter_player_summaries(steam_ids=sorted(users)):
+            idx += 1
+            print(f"{idx}. {user.personaname} ({user.steamid})")
+
 
 if __name__ == "__main__":
     asyncio.run(main())
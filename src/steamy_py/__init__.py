@@ -1,7 +1,9 @@
+from typing import TYPE_CHECKING
+
 # Main Steam client
 # Core components (for advanced users)
+from .cache import ResponseCache
 from .client import Client
-from .config import Settings
 
 # All exceptions
 from .exceptions import (
@@ -10,6 +12,7 @@ from .exceptions import (
     GameNotFoundError,
     InvalidAppIDError,
     InvalidSteamIDError,
+    MissingAccessTokenError,
     NetworkError,
     PlayerNotFoundError,
     PrivateProfileError,
@@ -40,6 +43,9 @@ from .models import (
 from .repos import FamilyAPI, GameAPI, MarketAPI, PlayerAPI, StatsAPI
 from .steam import Steam
 
+if TYPE_CHECKING:
+    from .config import Settings
+
 __version__ = "1.0.0"
 
 __all__ = [
@@ -48,9 +54,11 @@ __all__ = [
     # Core components
     "Client",
     "Settings",
+    "ResponseCache",
     # Exceptions
     "SteamAPIError",
     "AuthenticationError",
+    "MissingAccessTokenError",
     "RateLimitError",
     "PlayerNotFoundError",
     "GameNotFoundError",
@@ -84,3 +92,12 @@ __all__ = [
     # Version
     "__version__",
 ]
+
+
+def __getattr__(name: str):
+    # Settings pulls in pydantic-settings, so it is imported on first access
+    if name == "Settings":
+        from .config import Settings
+
+        return Settings
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,72 @@
+"""In-memory TTL cache for parsed Steam API responses."""
+
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+MISSING: Any = object()
+
+
+class ResponseCache:
+    """LRU cache with per-entry TTL for parsed API responses.
+
+    Values are stored exactly as the repositories return them (validated models
+    or lists of models), so a cache hit skips both the HTTP request and response
+    validation. Cached objects are shared between callers and must be treated
+    as immutable.
+
+    All operations are synchronous and never await, so they are atomic with
+    respect to other tasks on the event loop.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept before evicting the least
+                recently used one
+        """
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Any:
+        """Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or ``MISSING`` if absent or expired
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return MISSING
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return MISSING
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """Store a value.
+
+        Args:
+            key: Cache key
+            value: Parsed response to cache
+            ttl: Time to live in seconds
+        """
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -1,26 +1,189 @@
 """Async HTTP client with Steam API authentication and error handling."""
 
 import asyncio
+import base64
+import enum
+import hashlib
+import inspect
 import logging
+import math
+import random
 import time
-from typing import Any
+from collections.abc import Awaitable, Callable, Hashable, Mapping
+from contextlib import AbstractAsyncContextManager, nullcontext
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit
 
 import aiohttp
-from aiohttp import ClientError, ClientSession, ClientTimeout
+import orjson
+from aiohttp import ClientError, ClientResponseError, ClientSession, ClientTimeout
+from aiolimiter import AsyncLimiter
 
-from .config import Settings
+from .cache import ResponseCache
+from .exceptions import (
+    MissingAccessTokenError,
+    RateLimitError,
+    ServiceUnavailableError,
+)
+
+if TYPE_CHECKING:
+    from .config import Settings
 
 logger = logging.getLogger(__name__)
 
+# Statuses worth retrying: rate limiting and transient server errors
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+TokenProvider = Callable[[], Awaitable[str]] | Callable[[], str]
+
+
+class _TokenState(enum.Enum):
+    """Freshness of a cached access token."""
+
+    FRESH = "fresh"
+    STALE = "stale"
+    EXPIRED = "expired"
+
+
+class _TokenCache:
+    """Access token holder that refreshes the token before it expires.
+
+    Once the token is within *refresh_margin* seconds of expiring it becomes
+    stale: requests keep using it while a refresh runs in the background. Only
+    an expired (or missing) token makes a request wait for the refresh.
+    Concurrent refreshes are coalesced into a single provider call. Assigning
+    ``Client.access_token`` replaces the token by hand, e.g. to swap an
+    expired token when there is no provider.
+    """
+
+    def __init__(
+        self,
+        token: str | None,
+        provider: TokenProvider | None = None,
+        refresh_margin: float = 180.0,
+    ):
+        """Initialize the token cache.
+
+        Args:
+            token: Initial access token, if any
+            provider: Function or coroutine function returning a new access token
+            refresh_margin: Seconds before expiry at which the token is stale
+        """
+        self.provider = provider
+        self.refresh_margin = refresh_margin
+        self.token: str | None = None
+        self.expires_at: float | None = None
+        self._refresh_task: asyncio.Task | None = None
+        self._refresh_failed = False
+        self._lock = asyncio.Lock()
+        if token:
+            self._set(token)
+
+    def _set(self, token: str | None) -> None:
+        self.token = token
+        self.expires_at = _token_expiry(token) if token else None
+
+    @property
+    def state(self) -> _TokenState:
+        """Current freshness of the cached token."""
+        if not self.token:
+            return _TokenState.EXPIRED
+        if self.expires_at is None:
+            # Opaque token without a known expiry
+            return _TokenState.FRESH
+
+        remaining = self.expires_at - time.monotonic()
+        if remaining <= 0:
+            return _TokenState.EXPIRED
+        if remaining <= self.refresh_margin:
+            return _TokenState.STALE
+        return _TokenState.FRESH
+
+    async def get(self) -> str | None:
+        """Get a usable access token, refreshing it if needed.
+
+        Returns:
+            Access token, or None if there is none and no provider to get one
+
+        Raises:
+            Exception: Whatever the provider raises during a blocking refresh
+        """
+        state = self.state
+        if self.provider is None or state is _TokenState.FRESH:
+            return self.token
+
+        if state is _TokenState.STALE and not self._refresh_failed:
+            if self._refresh_task is None or self._refresh_task.done():
+                self._refresh_task = asyncio.create_task(self._refresh())
+                self._refresh_task.add_done_callback(self._on_refresh_done)
+            return self.token
+
+        # Expired, or the background refresh failed: wait for a new token
+        await self._refresh()
+        return self.token
+
+    async def _refresh(self) -> None:
+        async with self._lock:
+            # Another task refreshed the token while this one waited
+            if self.state is _TokenState.FRESH:
+                return
+
+            logger.debug("Refreshing Steam access token")
+            if inspect.iscoroutinefunction(self.provider):
+                token = await self.provider()
+            else:
+                # Plain functions may block, e.g. reading a token file, so they
+                # run in a worker thread instead of stalling the event loop
+                token = await asyncio.to_thread(self.provider)
+                if inspect.isawaitable(token):
+                    token = await token
+            self._set(token)
+            self._refresh_failed = False
+
+    def _on_refresh_done(self, task: asyncio.Task) -> None:
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            self._refresh_failed = True
+            logger.warning("Background access token refresh failed: %s", error)
+
+
+def _token_expiry(token: str) -> float | None:
+    """Get the monotonic expiry time from a JWT access token's exp claim.
+
+    Returns:
+        Expiry on the ``time.monotonic`` clock, or None if the token is not a
+        JWT with an expiry
+    """
+    try:
+        payload = token.split(".")[1]
+        claims = orjson.loads(
+            base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4))
+        )
+        exp = float(claims["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+    return time.monotonic() + (exp - time.time())
+
 
 class Client:
-    """Async HTTP client with Steam API authentication."""
+    """Async HTTP client with Steam API authentication.
+
+    ``access_token`` can be reassigned at any time, e.g. to rotate an expired
+    token by hand on a long-lived client without a token provider. Reassigning
+    ``api_key`` or ``access_token`` also moves the client to a new cache
+    partition, so responses fetched with the old credentials are not reused.
+    """
 
     def __init__(
         self,
         api_key: str | None = None,
         access_token: str | None = None,
-        settings: Settings | None = None,
+        settings: "Settings | None" = None,
+        cache: ResponseCache | None = None,
+        token_provider: TokenProvider | None = None,
     ):
         """Initialize the client.
 
@@ -28,12 +191,34 @@ class Client:
             api_key: Steam API key for public endpoint authentication
             access_token: Steam access token for user-specific endpoint authentication
             settings: Optional settings configuration
+            cache: Optional response cache, e.g. to share one between clients
+            token_provider: Optional function or coroutine function returning a
+                new access token, used to refresh the access token before it
+                expires. Plain functions run in a worker thread.
         """
-        self.api_key = api_key
-        self.access_token = access_token
-        self.settings = settings or Settings()
+        self._api_key = api_key
+        if settings is None:
+            # Imported on first use, as pydantic-settings is slow to import
+            from .config import get_settings
+
+            settings = get_settings()
+
+        self.settings = settings
+        self._token = _TokenCache(
+            access_token, token_provider, self.settings.TOKEN_REFRESH_MARGIN
+        )
+        self.cache = (
+            cache if cache is not None else ResponseCache(self.settings.CACHE_MAX_SIZE)
+        )
+        # Token the caller passed in, which provider refreshes keep in the
+        # same cache partition as they are for the same user
+        self._credential_token = access_token
+        self._update_auth_key()
+        # Requests shared by concurrent callers asking for the same cache key
+        self._inflight: dict[Hashable, asyncio.Future] = {}
         self._session: ClientSession | None = None
-        self._last_request_time = 0.0
+        self._semaphore = asyncio.Semaphore(self.settings.MAX_CONCURRENT_REQUESTS)
+        self._rate_limiters: dict[str, AsyncLimiter] = {}
 
         # Setup logging
         logging.basicConfig(
@@ -41,6 +226,37 @@ class Client:
             format=self.settings.LOG_FORMAT,
         )
 
+    def _update_auth_key(self) -> None:
+        # Separates cache entries of clients sharing a cache, without keeping
+        # the credentials themselves in cache keys
+        self._auth_key = hashlib.blake2b(
+            f"{self._api_key or ''}\n{self._credential_token or ''}".encode(),
+            digest_size=8,
+        ).digest()
+
+    @property
+    def api_key(self) -> str | None:
+        """Steam API key."""
+        return self._api_key
+
+    @api_key.setter
+    def api_key(self, value: str | None) -> None:
+        self._api_key = value
+        self._update_auth_key()
+
+    @property
+    def access_token(self) -> str | None:
+        """Current Steam access token."""
+        return self._token.token
+
+    @access_token.setter
+    def access_token(self, value: str | None) -> None:
+        self._token._set(value)
+        # A new token is worth trying even if the last provider refresh failed
+        self._token._refresh_failed = False
+        self._credential_token = value
+        self._update_auth_key()
+
     async def __aenter__(self):
         """Async context manager entry - creates session."""
         await self.connect()
@@ -51,12 +267,21 @@ class Client:
         await self.close()
 
     async def connect(self):
-        """Initialize aiohttp session."""
+        """Initialize aiohttp session.
+
+        The session and its connection pool live until *close*, so requests
+        reuse kept-alive connections instead of repeating TCP and TLS handshakes.
+        """
         if self._session and not self._session.closed:
             return
 
         timeout = ClientTimeout(total=self.settings.REQUEST_TIMEOUT)
-        connector = aiohttp.TCPConnector(limit=100)
+        connector = aiohttp.TCPConnector(
+            limit=self.settings.MAX_CONNECTIONS,
+            limit_per_host=self.settings.MAX_CONCURRENT_REQUESTS,
+            ttl_dns_cache=self.settings.DNS_CACHE_TTL,
+            keepalive_timeout=self.settings.KEEPALIVE_TIMEOUT,
+        )
 
         self._session = ClientSession(
             timeout=timeout,
@@ -70,31 +295,36 @@ class Client:
         logger.info("Steam API client connected")
 
     async def close(self):
-        """Close the session."""
+        """Close the session and its connection pool."""
         if self._session and not self._session.closed:
             await self._session.close()
             logger.info("Steam API client disconnected")
 
-    async def _rate_limit(self):
-        """Apply rate limiting if enabled."""
-        if not self.settings.RATE_LIMIT_ENABLED:
-            return
-
-        now = time.time()
-        time_since_last = now - self._last_request_time
-        min_interval = 1.0 / self.settings.REQUESTS_PER_SECOND
-
-        if time_since_last < min_interval:
-            sleep_time = min_interval - time_since_last
-            await asyncio.sleep(sleep_time)
+    def _rate_limiter(self, url: str) -> AbstractAsyncContextManager:
+        """Get the token bucket limiting requests to the URL's host.
 
-        self._last_request_time = time.time()
+        Each host (Web API, store, community market) has its own bucket, as
+        Steam enforces their quotas separately.
+        """
+        if not self.settings.RATE_LIMIT_ENABLED:
+            return nullcontext()
+
+        host = urlsplit(url).netloc
+        limiter = self._rate_limiters.get(host)
+        if limiter is None:
+            # The bucket must hold at least one token, so rates below one
+            # request per second are spread over a longer period instead
+            rps = self.settings.REQUESTS_PER_SECOND
+            rate = max(rps, 1.0)
+            limiter = AsyncLimiter(rate, rate / rps)
+            self._rate_limiters[host] = limiter
+        return limiter
 
     async def request(
         self,
         method: str,
         url: str,
-        params: dict[str, Any] | None = None,
+        params: Mapping[str, Any] | None = None,
         auth_type: str = "api_key",
         **kwargs,
     ) -> dict[str, Any]:
@@ -111,24 +341,88 @@ class Client:
             JSON response data
 
         Raises:
+            MissingAccessTokenError: If access token auth is used without a token
+            RateLimitError: If still rate limited after all retries
+            ServiceUnavailableError: If Steam is still unavailable after all retries
             ClientError: On HTTP errors
             ValueError: On invalid JSON response
         """
-        if not self._session:
-            await self.connect()
+        body = await self.request_raw(
+            method, url, params=params, auth_type=auth_type, **kwargs
+        )
+        return self.decode_json(body, url)
+
+    def decode_json(self, body: bytes, url: str) -> dict[str, Any]:
+        """Decode a JSON response body.
+
+        Args:
+            body: Raw response body
+            url: URL the body was returned from, for logging
 
-        # Add authentication to parameters
-        if params is None:
-            params = {}
+        Returns:
+            JSON response data
 
+        Raises:
+            ValueError: On invalid JSON response
+        """
+        try:
+            data = orjson.loads(body)
+        except ValueError as e:
+            logger.error("Invalid JSON response from %s: %s", url, e)
+            raise ValueError(f"Invalid JSON response: {e}") from e
+
+        logger.debug("Successful response from %s", url)
+        return data
+
+    async def request_raw(
+        self,
+        method: str,
+        url: str,
+        params: Mapping[str, Any] | None = None,
+        auth_type: str = "api_key",
+        **kwargs,
+    ) -> bytes:
+        """Make authenticated request to Steam API and return the raw body.
+
+        Useful to validate large responses straight from JSON bytes with
+        ``Model.model_validate_json``, skipping the intermediate Python objects.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            url: Complete URL to request
+            params: Query parameters
+            auth_type: Authentication type ("api_key", "access_token", or "none")
+            **kwargs: Additional aiohttp parameters
+
+        Returns:
+            Response body
+
+        Raises:
+            MissingAccessTokenError: If access token auth is used without a token
+            RateLimitError: If still rate limited after all retries
+            ServiceUnavailableError: If Steam is still unavailable after all retries
+            ClientError: On HTTP errors
+        """
+        if self._session is None or self._session.closed:
+            await self.connect()
+
+        # Add authentication to a copy of the parameters, as the caller's
+        # mapping may be shared or read-only
         if auth_type == "api_key":
             if not self.api_key:
                 raise ValueError("API key is required but not provided")
-            params["key"] = self.api_key
+            params = (
+                {**params, "key": self.api_key} if params else {"key": self.api_key}
+            )
         elif auth_type == "access_token":
-            if not self.access_token:
-                raise ValueError("Access token is required but not provided")
-            params["access_token"] = self.access_token
+            access_token = await self._token.get()
+            if not access_token:
+                raise MissingAccessTokenError()
+            params = (
+                {**params, "access_token": access_token}
+                if params
+                else {"access_token": access_token}
+            )
         elif auth_type == "none":
             # No authentication required (for some public endpoints)
             pass
@@ -137,56 +431,99 @@ class Client:
                 f"Invalid auth_type: {auth_type}. Must be 'api_key', 'access_token', or 'none'"
             )
 
-        # Apply rate limiting
-        await self._rate_limit()
-
         # Retry logic
-        last_exception = None
-        for attempt in range(self.settings.MAX_RETRIES + 1):
+        max_retries = self.settings.MAX_RETRIES
+        for attempt in range(max_retries + 1):
+            retry_after: float | None = None
             try:
                 logger.debug(
-                    f"Making {method} request to {url} (attempt {attempt + 1})"
+                    "Making %s request to %s (attempt %s)", method, url, attempt + 1
                 )
 
-                async with self._session.request(
-                    method, url, params=params, **kwargs
-                ) as response:
-                    # Check for rate limiting
-                    if response.status == 429:
-                        retry_after = float(
-                            response.headers.get(
-                                "Retry-After", self.settings.RETRY_DELAY
-                            )
+                async with (
+                    self._rate_limiter(url),
+                    self._semaphore,
+                    self._session.request(
+                        method, url, params=params, **kwargs
+                    ) as response,
+                ):
+                    if response.status in RETRY_STATUSES and attempt < max_retries:
+                        retry_after = _parse_retry_after(
+                            response.headers.get("Retry-After")
                         )
-                        logger.warning(
-                            f"Rate limited, sleeping for {retry_after} seconds"
-                        )
-                        await asyncio.sleep(retry_after)
-                        continue
-
-                    # Raise for HTTP errors
-                    response.raise_for_status()
-
-                    # Parse JSON response
-                    try:
-                        data = await response.json()
-                        logger.debug(f"Successful response from {url}")
-                        return data
-                    except (ValueError, aiohttp.ContentTypeError) as e:
-                        logger.error(f"Invalid JSON response from {url}: {e}")
-                        raise ValueError(f"Invalid JSON response: {e}")
-
-            except ClientError as e:
-                last_exception = e
-                if attempt < self.settings.MAX_RETRIES:
-                    sleep_time = self.settings.RETRY_DELAY * (2**attempt)
-                    logger.warning(
-                        f"Request failed (attempt {attempt + 1}), retrying in {sleep_time} seconds: {e}"
-                    )
-                    await asyncio.sleep(sleep_time)
-                else:
+                        reason = f"status {response.status}"
+                    else:
+                        if response.status == 429:
+                            retry_after = _parse_retry_after(
+                                response.headers.get("Retry-After")
+                            )
+                            raise RateLimitError(
+                                retry_after=math.ceil(retry_after)
+                                if retry_after is not None
+                                else None
+                            )
+                        if response.status == 503:
+                            raise ServiceUnavailableError()
+
+                        # Raise for HTTP errors
+                        response.raise_for_status()
+
+                        return await response.read()
+
+            except ClientResponseError:
+                # Non-retryable status, or retries are exhausted
+                raise
+            except (ClientError, TimeoutError) as e:
+                if attempt == max_retries:
                     logger.error(
-                        f"Request failed after {self.settings.MAX_RETRIES + 1} attempts: {e}"
+                        "Request failed after %s attempts: %s", max_retries + 1, e
                     )
+                    raise
+                reason = str(e) or type(e).__name__
+
+            sleep_time = self._retry_delay(attempt, retry_after)
+            logger.warning(
+                "Request failed (attempt %s, %s), retrying in %.2f seconds",
+                attempt + 1,
+                reason,
+                sleep_time,
+            )
+            await asyncio.sleep(sleep_time)
+
+        raise ClientError("Request failed for unknown reason")
+
+    def _retry_delay(self, attempt: int, retry_after: float | None = None) -> float:
+        """Compute the delay before the next retry.
+
+        Uses exponential backoff with full jitter, so concurrent clients that
+        failed together do not retry in lockstep. A server-provided Retry-After
+        is treated as a lower bound.
+
+        Args:
+            attempt: Zero-based number of the failed attempt
+            retry_after: Seconds from the Retry-After header, if any
+
+        Returns:
+            Delay in seconds
+        """
+        backoff = min(
+            self.settings.RETRY_MAX_DELAY, self.settings.RETRY_DELAY * 2**attempt
+        )
+        return max(retry_after or 0.0, random.random() * backoff)
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header given as seconds or as an HTTP date."""
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
 
-        raise last_exception or ClientError("Request failed for unknown reason")
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
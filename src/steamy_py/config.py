@@ -1,5 +1,7 @@
 """Configuration settings for Steam API wrapper."""
 
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -14,11 +16,31 @@ class Settings(BaseSettings):
     REQUEST_TIMEOUT: int = 30
     MAX_RETRIES: int = 3
     RETRY_DELAY: float = 1.0
+    RETRY_MAX_DELAY: float = 30.0
+
+    # Connection Pooling
+    MAX_CONNECTIONS: int = 64
+    MAX_CONCURRENT_REQUESTS: int = 16
+    DNS_CACHE_TTL: int = 300
+    KEEPALIVE_TIMEOUT: float = 60.0
+
+    # Access Token Refresh (seconds before expiry to refresh in the background)
+    TOKEN_REFRESH_MARGIN: float = 180.0
 
     # Rate Limiting
     RATE_LIMIT_ENABLED: bool = True
     REQUESTS_PER_SECOND: float = 10.0
 
+    # Response Caching (TTLs in seconds, 0 disables caching for the endpoint)
+    CACHE_ENABLED: bool = True
+    CACHE_MAX_SIZE: int = 1024
+    PLAYER_SUMMARIES_TTL: float = 60.0
+    FAMILY_GROUP_TTL: float = 300.0
+    SHARED_LIBRARY_APPS_TTL: float = 300.0
+    PLAYTIME_SUMMARY_TTL: float = 60.0
+    PLAYER_BANS_TTL: float = 300.0
+    RESOLVE_VANITY_URL_TTL: float = 3600.0
+
     # Logging
     LOG_LEVEL: str = "INFO"
     LOG_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -26,3 +48,17 @@ class Settings(BaseSettings):
     model_config = SettingsConfigDict(
         env_file=".env", env_file_encoding="utf-8", case_sensitive=True, extra="ignore"
     )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get default settings, loaded from the environment and .env once.
+
+    The instance is shared by every client created without explicit settings,
+    so changes to environment variables or .env take effect only after a
+    process restart.
+
+    Returns:
+        Shared settings instance
+    """
+    return Settings()
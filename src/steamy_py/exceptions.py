@@ -6,6 +6,8 @@ from typing import Any
 class SteamAPIError(Exception):
     """Base Steam API exception."""
 
+    __slots__ = ("response_data", "status_code")
+
     def __init__(
         self,
         message: str,
@@ -23,17 +25,44 @@ class SteamAPIError(Exception):
         self.status_code = status_code
         self.response_data = response_data
 
+    def __reduce__(self):
+        """Pickle with slot attributes, which BaseException leaves out.
+
+        Subclass constructors take different arguments than ``args`` holds, so
+        the original ``args`` are restored along with the attributes.
+        """
+        state = {"args": self.args}
+        for cls in type(self).__mro__:
+            for name in cls.__dict__.get("__slots__", ()):
+                if hasattr(self, name):
+                    state[name] = getattr(self, name)
+        state.update(self.__dict__)
+        return type(self), self.args, state
+
 
 class AuthenticationError(SteamAPIError):
     """Invalid or missing API key."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Invalid or missing Steam API key"):
         super().__init__(message, status_code=401)
 
 
+class MissingAccessTokenError(AuthenticationError):
+    """Access token required by an endpoint was not provided."""
+
+    __slots__ = ()
+
+    def __init__(self, message: str = "Access token is required but not provided"):
+        super().__init__(message)
+
+
 class RateLimitError(SteamAPIError):
     """Rate limit exceeded."""
 
+    __slots__ = ("retry_after",)
+
     def __init__(
         self, message: str = "Rate limit exceeded", retry_after: int | None = None
     ):
@@ -44,6 +73,8 @@ class RateLimitError(SteamAPIError):
 class PlayerNotFoundError(SteamAPIError):
     """Player/Steam ID not found."""
 
+    __slots__ = ("steamid",)
+
     def __init__(self, steamid: str, message: str | None = None):
         if message is None:
             message = f"Player with Steam ID '{steamid}' not found"
@@ -54,6 +85,8 @@ class PlayerNotFoundError(SteamAPIError):
 class GameNotFoundError(SteamAPIError):
     """Game/App ID not found."""
 
+    __slots__ = ("app_id",)
+
     def __init__(self, app_id: str, message: str | None = None):
         if message is None:
             message = f"Game with App ID '{app_id}' not found"
@@ -64,6 +97,8 @@ class GameNotFoundError(SteamAPIError):
 class InvalidSteamIDError(SteamAPIError):
     """Invalid Steam ID format."""
 
+    __slots__ = ("steamid",)
+
     def __init__(self, steamid: str, message: str | None = None):
         if message is None:
             message = f"Invalid Steam ID format: '{steamid}'"
@@ -74,6 +109,8 @@ class InvalidSteamIDError(SteamAPIError):
 class InvalidAppIDError(SteamAPIError):
     """Invalid App ID format."""
 
+    __slots__ = ("app_id",)
+
     def __init__(self, app_id: str, message: str | None = None):
         if message is None:
             message = f"Invalid App ID format: '{app_id}'"
@@ -84,6 +121,8 @@ class InvalidAppIDError(SteamAPIError):
 class PrivateProfileError(SteamAPIError):
     """Player profile is private or not accessible."""
 
+    __slots__ = ("steamid",)
+
     def __init__(self, steamid: str, message: str | None = None):
         if message is None:
             message = f"Profile for Steam ID '{steamid}' is private or not accessible"
@@ -94,6 +133,8 @@ class PrivateProfileError(SteamAPIError):
 class ServiceUnavailableError(SteamAPIError):
     """Steam API service is temporarily unavailable."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Steam API service is temporarily unavailable"):
         super().__init__(message, status_code=503)
 
@@ -101,6 +142,8 @@ class ServiceUnavailableError(SteamAPIError):
 class ConfigurationError(SteamAPIError):
     """Configuration or setup error."""
 
+    __slots__ = ()
+
     def __init__(self, message: str):
         super().__init__(message)
 
@@ -108,6 +151,8 @@ class ConfigurationError(SteamAPIError):
 class ResponseParsingError(SteamAPIError):
     """Error parsing Steam API response."""
 
+    __slots__ = ("raw_response",)
+
     def __init__(self, message: str, raw_response: str | None = None):
         super().__init__(message)
         self.raw_response = raw_response
@@ -116,6 +161,8 @@ class ResponseParsingError(SteamAPIError):
 class NetworkError(SteamAPIError):
     """Network or connection error."""
 
+    __slots__ = ("original_error",)
+
     def __init__(self, message: str, original_error: Exception | None = None):
         super().__init__(message)
         self.original_error = original_error
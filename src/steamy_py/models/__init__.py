@@ -1,8 +1,23 @@
 """Data models for Steam API."""
 
+from pydantic import BaseModel
+
 # Base models
 from .base import ErrorResponse, PaginatedResponse, SteamModel, SteamResponse
 
+# Family models
+from .family import (
+    Entry,
+    FamilyGroupStatus,
+    FamilyGroupStatusResponse,
+    MembershipHistoryEntry,
+    PlaytimeSummaryData,
+    PlaytimeSummaryResponse,
+    SharedLibraryApp,
+    SharedLibraryAppsData,
+    SharedLibraryAppsResponse,
+)
+
 # Game models
 from .game import (
     Achievement,
@@ -95,6 +110,16 @@ __all__ = [
     "FriendsListResponse",
     "PlayerBansResponse",
     "ResolveVanityURLResponse",
+    # Family models
+    "MembershipHistoryEntry",
+    "FamilyGroupStatus",
+    "FamilyGroupStatusResponse",
+    "Entry",
+    "PlaytimeSummaryData",
+    "PlaytimeSummaryResponse",
+    "SharedLibraryApp",
+    "SharedLibraryAppsData",
+    "SharedLibraryAppsResponse",
     # Game models
     "OwnedGame",
     "SteamApp",
@@ -146,3 +171,11 @@ __all__ = [
     "GetPlayerCountResponse",
     "GetNewsResponse",
 ]
+
+# Finish any model schema left incomplete at class creation (e.g. by forward
+# references) at import time, instead of on the first request that validates it
+for _name in __all__:
+    _model = globals()[_name]
+    if issubclass(_model, BaseModel):
+        _model.model_rebuild()
+del _name, _model
@@ -4,12 +4,15 @@ from pydantic import BaseModel, ConfigDict
 
 
 class SteamModel(BaseModel):
-    """Base class for all Steam API response models."""
+    """Base class for all Steam API response models.
+
+    Models are read-only snapshots of API responses: they are frozen, and
+    strings are kept exactly as Steam returned them.
+    """
 
     model_config = ConfigDict(
         extra="ignore",
-        str_strip_whitespace=True,
-        validate_assignment=True,
+        frozen=True,
         use_enum_values=True,
         populate_by_name=True,
     )
@@ -1,7 +1,14 @@
-from pydantic import BaseModel, Field
+"""Family group related data models for Steam API."""
 
+import sys
+import warnings
 
-class MembershipHistoryEntry(BaseModel):
+from pydantic import Field, field_validator
+
+from .base import SteamModel
+
+
+class MembershipHistoryEntry(SteamModel):
     family_groupid: str = Field(..., description="Steam family group id")
     rtime_joined: int = Field(..., description="Time of joining this family group")
     rtime_left: int = Field(..., description="Time of leaving this family group")
@@ -9,7 +16,7 @@ class MembershipHistoryEntry(BaseModel):
     participated: bool = Field(..., description="")
 
 
-class FamilyGroupStatus(BaseModel):
+class FamilyGroupStatus(SteamModel):
     family_groupid: str = Field(..., description="Steam family group id")
     is_not_member_of_any_group: bool = Field(
         ..., description="Is current user member of any group?"
@@ -26,11 +33,11 @@ class FamilyGroupStatus(BaseModel):
     membership_history: list[MembershipHistoryEntry]
 
 
-class FamilyGroupStatusResponse(BaseModel):
+class FamilyGroupStatusResponse(SteamModel):
     response: FamilyGroupStatus
 
 
-class Entry(BaseModel):
+class Entry(SteamModel):
     steamid: str
     appid: int
     first_played: int
@@ -38,15 +45,15 @@ class Entry(BaseModel):
     seconds_played: int
 
 
-class ResponseData(BaseModel):
+class PlaytimeSummaryData(SteamModel):
     entries: list[Entry]
 
 
-class SteamResponse(BaseModel):
-    response: ResponseData
+class PlaytimeSummaryResponse(SteamModel):
+    response: PlaytimeSummaryData
 
 
-class SharedLibraryApp(BaseModel):
+class SharedLibraryApp(SteamModel):
     appid: int = Field(..., description="Steam app ID")
     owner_steamids: list[str] = Field(
         ..., description="Steam IDs of users who own this app"
@@ -69,10 +76,35 @@ class SharedLibraryApp(BaseModel):
         default_factory=list, description="Content descriptor IDs"
     )
 
+    @field_validator("owner_steamids")
+    @classmethod
+    def _intern_owner_steamids(cls, value: list[str]) -> list[str]:
+        """Share one string per owner, as a few owners repeat across all apps."""
+        return [sys.intern(steamid) for steamid in value]
+
 
-class SharedLibraryAppsData(BaseModel):
+class SharedLibraryAppsData(SteamModel):
     apps: list[SharedLibraryApp]
 
 
-class SharedLibraryAppsResponse(BaseModel):
+class SharedLibraryAppsResponse(SteamModel):
     response: SharedLibraryAppsData
+
+
+# Former names of the playtime summary models, kept for backwards compatibility
+_DEPRECATED_ALIASES = {
+    "SteamResponse": "PlaytimeSummaryResponse",
+    "ResponseData": "PlaytimeSummaryData",
+}
+
+
+def __getattr__(name: str):
+    if name in _DEPRECATED_ALIASES:
+        new_name = _DEPRECATED_ALIASES[name]
+        warnings.warn(
+            f"{__name__}.{name} is deprecated, use {new_name} instead",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return globals()[new_name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
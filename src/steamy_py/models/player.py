@@ -1,7 +1,8 @@
 """Player/User related data models for Steam API."""
 
-from datetime import datetime
+from datetime import UTC, datetime
 from enum import IntEnum
+from functools import lru_cache
 
 from pydantic import Field
 
@@ -28,6 +29,18 @@ class CommunityVisibilityState(IntEnum):
     PUBLIC = 3
 
 
+# State fields hold raw ints, so property checks compare against plain ints
+# instead of going through IntEnum
+_PERSONA_STATE_OFFLINE = int(PersonaState.OFFLINE)
+_VISIBILITY_STATE_PUBLIC = int(CommunityVisibilityState.PUBLIC)
+
+
+@lru_cache(maxsize=4096)
+def _utc_datetime(timestamp: int) -> datetime:
+    """Convert Unix timestamp to UTC datetime, cached as datetimes are immutable."""
+    return datetime.fromtimestamp(timestamp, tz=UTC)
+
+
 class PlayerSummary(SteamModel):
     """Steam player summary information."""
 
@@ -38,10 +51,10 @@ class PlayerSummary(SteamModel):
     avatarmedium: str = Field(description="64x64 pixel avatar URL")
     avatarfull: str = Field(description="184x184 pixel avatar URL")
 
-    personastate: PersonaState = Field(description="Current online status")
-    communityvisibilitystate: CommunityVisibilityState = Field(
-        description="Profile visibility"
-    )
+    # Typed as plain ints to skip enum lookups during validation; values match
+    # PersonaState and CommunityVisibilityState
+    personastate: int = Field(description="Current online status")
+    communityvisibilitystate: int = Field(description="Profile visibility")
     profilestate: int | None = Field(default=None, description="Profile setup state")
 
     lastlogoff: int | None = Field(
@@ -75,7 +88,7 @@ class PlayerSummary(SteamModel):
     @property
     def is_online(self) -> bool:
         """Check if player is currently online."""
-        return self.personastate != PersonaState.OFFLINE
+        return self.personastate != _PERSONA_STATE_OFFLINE
 
     @property
     def is_in_game(self) -> bool:
@@ -85,7 +98,7 @@ class PlayerSummary(SteamModel):
     @property
     def is_public(self) -> bool:
         """Check if profile is public."""
-        return self.communityvisibilitystate == CommunityVisibilityState.PUBLIC
+        return self.communityvisibilitystate == _VISIBILITY_STATE_PUBLIC
 
 
 class Friend(SteamModel):
@@ -99,20 +112,31 @@ class Friend(SteamModel):
 
     @property
     def friend_since_datetime(self) -> datetime | None:
-        """Get friendship start date as datetime object."""
-        return datetime.fromtimestamp(self.friend_since) if self.friend_since else None
+        """Get friendship start date as UTC datetime object."""
+        return (
+            _utc_datetime(self.friend_since) if self.friend_since is not None else None
+        )
 
 
 class PlayerBan(SteamModel):
     """Steam player ban information."""
 
-    steamid: str = Field(description="Steam ID of the player")
-    community_banned: bool = Field(description="Community ban status")
-    vac_banned: bool = Field(description="VAC ban status")
-    number_of_vac_bans: int = Field(description="Number of VAC bans")
-    days_since_last_ban: int = Field(description="Days since last ban")
-    number_of_game_bans: int = Field(description="Number of game bans")
-    economy_ban: str = Field(description="Economy ban status")
+    # GetPlayerBans is the one endpoint here with PascalCase keys
+    steamid: str = Field(alias="SteamId", description="Steam ID of the player")
+    community_banned: bool = Field(
+        alias="CommunityBanned", description="Community ban status"
+    )
+    vac_banned: bool = Field(alias="VACBanned", description="VAC ban status")
+    number_of_vac_bans: int = Field(
+        alias="NumberOfVACBans", description="Number of VAC bans"
+    )
+    days_since_last_ban: int = Field(
+        alias="DaysSinceLastBan", description="Days since last ban"
+    )
+    number_of_game_bans: int = Field(
+        alias="NumberOfGameBans", description="Number of game bans"
+    )
+    economy_ban: str = Field(alias="EconomyBan", description="Economy ban status")
 
     @property
     def is_banned(self) -> bool:
@@ -1,12 +1,34 @@
 """Base repository class for Steam API endpoints."""
 
+import asyncio
 import logging
-from typing import Any
+from collections.abc import Awaitable, Callable, Hashable, Mapping
+from functools import partial
+from types import MappingProxyType
+from typing import Any, NamedTuple, TypeVar
 
+from pydantic import BaseModel
+
+from ..cache import MISSING
 from ..client import Client
 
+T = TypeVar("T")
+
 logger = logging.getLogger(__name__)
 
+# Shared read-only params for requests without any, instead of a new dict per call
+_EMPTY_PARAMS: Mapping[str, Any] = MappingProxyType({})
+
+
+class Endpoint(NamedTuple):
+    """Invariant description of a Steam Web API method."""
+
+    interface: str
+    method: str
+    version: str = "v1"
+    auth_type: str = "api_key"
+    http_method: str = "GET"
+
 
 class BaseAPI:
     """Base class for all Steam API repositories."""
@@ -18,6 +40,7 @@ class BaseAPI:
             client: Authenticated Steam API client
         """
         self.client = client
+        self._urls: dict[tuple[str, str, str], str] = {}
 
     def _build_url(self, interface: str, method: str, version: str = "v1") -> str:
         """Build Steam API URL.
@@ -33,9 +56,17 @@ class BaseAPI:
         Example:
             _build_url("ISteamUser", "GetPlayerSummaries", "v2")
             -> "https://api.steampowered.com/ISteamUser/GetPlayerSummaries/v2/"
+
+        Note:
+            URLs are built once per method and reused, so the base URL is read
+            from settings only on the first request to each method.
         """
-        base_url = self.client.settings.STEAM_API_BASE_URL.rstrip("/")
-        return f"{base_url}/{interface}/{method}/{version}/"
+        key = (interface, method, version)
+        url = self._urls.get(key)
+        if url is None:
+            base_url = self.client.settings.STEAM_API_BASE_URL.rstrip("/")
+            url = self._urls[key] = f"{base_url}/{interface}/{method}/{version}/"
+        return url
 
     def _build_store_url(self, endpoint: str) -> str:
         """Build Steam Store API URL.
@@ -59,13 +90,16 @@ class BaseAPI:
         interface: str,
         method: str,
         version: str = "v1",
-        params: dict[str, Any] | None = None,
+        params: Mapping[str, Any] | None = None,
         auth_type: str = "api_key",
         http_method: str = "GET",
         **kwargs,
     ) -> dict[str, Any]:
         """Make authenticated request to Steam API.
 
+        Concurrent identical GET requests share a single round trip. Each caller
+        decodes the shared body itself, so the returned data is never shared.
+
         Args:
             interface: Steam API interface name
             method: Method name
@@ -81,20 +115,278 @@ class BaseAPI:
         Raises:
             ClientError: On HTTP or API errors
         """
+        # Only plain GETs are safe to share: other methods may have side effects
+        if http_method != "GET" or kwargs:
+            return await self._send_request(
+                interface, method, version, params, auth_type, http_method, **kwargs
+            )
+
+        key = (
+            "raw",
+            *self._request_key(interface, method, version, params, auth_type),
+        )
+        body = await self._single_flight(
+            key,
+            partial(self._request_raw, interface, method, version, params, auth_type),
+            f"{interface}/{method}/{version}",
+        )
+        return self.client.decode_json(
+            body, self._build_url(interface, method, version)
+        )
+
+    async def _send_request(
+        self,
+        interface: str,
+        method: str,
+        version: str,
+        params: Mapping[str, Any] | None,
+        auth_type: str,
+        http_method: str,
+        **kwargs,
+    ) -> dict[str, Any]:
+        """Send request to Steam API and decode the JSON response."""
         url = self._build_url(interface, method, version)
 
         logger.debug(
-            f"Making {http_method} request to {interface}/{method}/{version} with auth: {auth_type}"
+            "Making %s request to %s/%s/%s with auth: %s",
+            http_method,
+            interface,
+            method,
+            version,
+            auth_type,
         )
 
         return await self.client.request(
             http_method, url, params=params, auth_type=auth_type, **kwargs
         )
 
+    async def _request_ep(
+        self, ep: Endpoint, params: Mapping[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Make authenticated request to the Steam API method *ep* describes.
+
+        Args:
+            ep: Endpoint descriptor
+            params: Query parameters
+
+        Returns:
+            JSON response data
+
+        Raises:
+            ClientError: On HTTP or API errors
+        """
+        return await self._request(
+            ep.interface, ep.method, ep.version, params, ep.auth_type, ep.http_method
+        )
+
+    async def _request_raw(
+        self,
+        interface: str,
+        method: str,
+        version: str = "v1",
+        params: Mapping[str, Any] | None = None,
+        auth_type: str = "api_key",
+        http_method: str = "GET",
+        **kwargs,
+    ) -> bytes:
+        """Make authenticated request to Steam API and return the raw body.
+
+        Args:
+            interface: Steam API interface name
+            method: Method name
+            version: API version
+            params: Query parameters
+            auth_type: Authentication type ("api_key", "access_token", or "none")
+            http_method: HTTP method ("GET", "POST", "PUT", "DELETE")
+            **kwargs: Additional request parameters
+
+        Returns:
+            Raw JSON response body
+
+        Raises:
+            ClientError: On HTTP or API errors
+        """
+        url = self._build_url(interface, method, version)
+
+        logger.debug(
+            "Making %s request to %s/%s/%s with auth: %s",
+            http_method,
+            interface,
+            method,
+            version,
+            auth_type,
+        )
+
+        return await self.client.request_raw(
+            http_method, url, params=params, auth_type=auth_type, **kwargs
+        )
+
+    async def _cached_request(
+        self,
+        ttl: float,
+        parse: type[T] | Callable[[dict[str, Any]], T],
+        interface: str,
+        method: str,
+        version: str = "v1",
+        params: Mapping[str, Any] | None = None,
+        auth_type: str = "api_key",
+        http_method: str = "GET",
+    ) -> T:
+        """Make read-only request to Steam API and cache the parsed response.
+
+        The parsed object is stored in the client's response cache, so repeated
+        calls within ``ttl`` skip both the network and response validation.
+        Cached objects are shared between callers and must not be mutated.
+
+        Concurrent misses for the same key share a single request: later callers
+        wait for the one already in flight instead of sending a duplicate.
+
+        Args:
+            ttl: Time to live in seconds (0 disables caching)
+            parse: Pydantic model validated straight from the raw JSON body, or
+                a callable converting the decoded JSON into the returned object
+            interface: Steam API interface name
+            method: Method name
+            version: API version
+            params: Query parameters
+            auth_type: Authentication type ("api_key", "access_token", or "none")
+            http_method: HTTP method, for read-only endpoints served over POST
+
+        Returns:
+            Parsed response
+
+        Raises:
+            ClientError: On HTTP or API errors
+        """
+        key = self._request_key(interface, method, version, params, auth_type)
+        label = f"{interface}/{method}/{version}"
+        fetch = partial(
+            self._fetch,
+            parse,
+            interface,
+            method,
+            version,
+            params,
+            auth_type,
+            http_method,
+        )
+
+        if not self.client.settings.CACHE_ENABLED or ttl <= 0:
+            return await self._single_flight(key, fetch, label)
+
+        cached = self.client.cache.get(key)
+        if cached is not MISSING:
+            logger.debug("Cache hit for %s", label)
+            return cached
+
+        return await self._single_flight(
+            key, partial(self._fetch_and_cache, key, ttl, fetch), label
+        )
+
+    async def _cached_request_ep(
+        self,
+        ttl: float,
+        parse: type[T] | Callable[[dict[str, Any]], T],
+        ep: Endpoint,
+        params: Mapping[str, Any] | None = None,
+    ) -> T:
+        """Make read-only request to the method *ep* describes and cache it.
+
+        See *_cached_request* for caching details.
+        """
+        return await self._cached_request(
+            ttl,
+            parse,
+            ep.interface,
+            ep.method,
+            ep.version,
+            params,
+            ep.auth_type,
+            ep.http_method,
+        )
+
+    async def _fetch_and_cache(
+        self, key: Hashable, ttl: float, fetch: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Fetch and parse a response, then store it in the response cache."""
+        result = await fetch()
+        self.client.cache.set(key, result, ttl)
+        return result
+
+    def _request_key(
+        self,
+        interface: str,
+        method: str,
+        version: str,
+        params: Mapping[str, Any] | None,
+        auth_type: str,
+    ) -> tuple:
+        """Build the key identifying a request's response for its credentials."""
+        return (
+            self.client._auth_key,
+            auth_type,
+            interface,
+            method,
+            version,
+            tuple(sorted((params or {}).items())),
+        )
+
+    async def _single_flight(
+        self, key: Hashable, fetch: Callable[[], Awaitable[T]], label: str
+    ) -> T:
+        """Run *fetch* unless an identical request is already in flight.
+
+        The first caller starts *fetch* as a task, and concurrent callers with
+        the same key await that task instead of sending a duplicate request.
+
+        Args:
+            key: Key identifying the request
+            fetch: Coroutine function performing the request
+            label: Endpoint name for logging
+
+        Returns:
+            Result of the shared request
+        """
+        inflight = self.client._inflight
+        task = inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            inflight[key] = task
+            task.add_done_callback(lambda _: inflight.pop(key, None))
+        else:
+            logger.debug("Joining in-flight request to %s", label)
+
+        # Shielded, so a cancelled caller does not cancel the request for others
+        return await asyncio.shield(task)
+
+    async def _fetch(
+        self,
+        parse: type[T] | Callable[[dict[str, Any]], T],
+        interface: str,
+        method: str,
+        version: str,
+        params: Mapping[str, Any] | None,
+        auth_type: str,
+        http_method: str = "GET",
+    ) -> T:
+        """Make request to Steam API and parse the response."""
+        if isinstance(parse, type) and issubclass(parse, BaseModel):
+            # Parse and validate in pydantic-core, without building Python dicts
+            return parse.model_validate_json(
+                await self._request_raw(
+                    interface, method, version, params, auth_type, http_method
+                )
+            )
+        return parse(
+            await self._send_request(
+                interface, method, version, params, auth_type, http_method
+            )
+        )
+
     async def _request_store(
         self,
         endpoint: str,
-        params: dict[str, Any] | None = None,
+        params: Mapping[str, Any] | None = None,
         auth_type: str = "none",
         http_method: str = "GET",
         **kwargs,
@@ -117,7 +409,10 @@ class BaseAPI:
         url = self._build_store_url(endpoint)
 
         logger.debug(
-            f"Making {http_method} store request to {endpoint} with auth: {auth_type}"
+            "Making %s store request to %s with auth: %s",
+            http_method,
+            endpoint,
+            auth_type,
         )
 
         return await self.client.request(
@@ -130,7 +425,7 @@ class BaseAPI:
         interface: str,
         method: str,
         version: str = "v1",
-        params: dict[str, Any] | None = None,
+        params: Mapping[str, Any] | None = None,
         auth_type: str = "api_key",
         **kwargs,
     ) -> dict[str, Any]:
@@ -144,7 +439,7 @@ class BaseAPI:
         interface: str,
         method: str,
         version: str = "v1",
-        params: dict[str, Any] | None = None,
+        params: Mapping[str, Any] | None = None,
         auth_type: str = "api_key",
         **kwargs,
     ) -> dict[str, Any]:
@@ -158,7 +453,7 @@ class BaseAPI:
         interface: str,
         method: str,
         version: str = "v1",
-        params: dict[str, Any] | None = None,
+        params: Mapping[str, Any] | None = None,
         auth_type: str = "api_key",
         **kwargs,
     ) -> dict[str, Any]:
@@ -172,7 +467,7 @@ class BaseAPI:
         interface: str,
         method: str,
         version: str = "v1",
-        params: dict[str, Any] | None = None,
+        params: Mapping[str, Any] | None = None,
         auth_type: str = "api_key",
         **kwargs,
     ) -> dict[str, Any]:
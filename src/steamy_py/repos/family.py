@@ -1,18 +1,71 @@
 """Steam Family API endpoints."""
 
+import asyncio
+import copy
 import logging
+from typing import Any
 
-from ..exceptions import AuthenticationError, SteamAPIError
+from ..exceptions import SteamAPIError
 from ..models.family import (
     FamilyGroupStatusResponse,
+    PlaytimeSummaryResponse,
     SharedLibraryAppsResponse,
-    SteamResponse,
 )
-from .base import BaseAPI
+from .base import _EMPTY_PARAMS, BaseAPI, Endpoint
 
 logger = logging.getLogger(__name__)
 
 
+def _family_endpoint(method: str, http_method: str = "GET") -> Endpoint:
+    """Describe an IFamilyGroupsService method, all of which need an access token."""
+    return Endpoint("IFamilyGroupsService", method, "v1", "access_token", http_method)
+
+
+_CANCEL_FAMILY_GROUP_INVITE = _family_endpoint(
+    "CancelFamilyGroupInvite", http_method="POST"
+)
+_CLEAR_COOLDOWN_SKIP = _family_endpoint("ClearCooldownSkip", http_method="POST")
+_CONFIRM_INVITE_TO_FAMILY_GROUP = _family_endpoint(
+    "ConfirmInviteToFamilyGroup", http_method="POST"
+)
+_CONFIRM_JOIN_FAMILY_GROUP = _family_endpoint(
+    "ConfirmJoinFamilyGroup", http_method="POST"
+)
+_CREATE_FAMILY_GROUP = _family_endpoint("CreateFamilyGroup", http_method="POST")
+_DELETE_FAMILY_GROUP = _family_endpoint("DeleteFamilyGroup", http_method="POST")
+_FORCE_ACCEPT_INVITE = _family_endpoint("ForceAcceptInvite", http_method="POST")
+_GET_CHANGE_LOG = _family_endpoint("GetChangeLog")
+_GET_FAMILY_GROUP = _family_endpoint("GetFamilyGroup")
+_GET_FAMILY_GROUP_FOR_USER = _family_endpoint("GetFamilyGroupForUser")
+_GET_INVITE_CHECK_RESULTS = _family_endpoint("GetInviteCheckResults")
+_GET_PLAYTIME_SUMMARY = _family_endpoint("GetPlaytimeSummary", http_method="POST")
+_GET_PREFERRED_LENDERS = _family_endpoint("GetPreferredLenders")
+_GET_PURCHASE_REQUESTS = _family_endpoint("GetPurchaseRequests")
+_GET_SHARED_LIBRARY_APPS = _family_endpoint("GetSharedLibraryApps")
+_GET_USERS_SHARING_DEVICE = _family_endpoint("GetUsersSharingDevice")
+_INVITE_TO_FAMILY_GROUP = _family_endpoint("InviteToFamilyGroup", http_method="POST")
+_JOIN_FAMILY_GROUP = _family_endpoint("JoinFamilyGroup", http_method="POST")
+_MODIFY_FAMILY_GROUP_DETAILS = _family_endpoint(
+    "ModifyFamilyGroupDetails", http_method="POST"
+)
+_REMOVE_FROM_FAMILY_GROUP = _family_endpoint(
+    "RemoveFromFamilyGroup", http_method="POST"
+)
+_REQUEST_PURCHASE = _family_endpoint("RequestPurchase", http_method="POST")
+_RESEND_INVITATION_TO_FAMILY_GROUP = _family_endpoint(
+    "ResendInvitationToFamilyGroup", http_method="POST"
+)
+_RESPOND_TO_REQUESTED_PURCHASE = _family_endpoint(
+    "RespondToRequestedPurchase", http_method="POST"
+)
+_ROLLBACK_FAMILY_GROUP = _family_endpoint("RollbackFamilyGroup", http_method="POST")
+_SET_FAMILY_COOLDOWN_OVERRIDES = _family_endpoint(
+    "SetFamilyCooldownOverrides", http_method="POST"
+)
+_SET_PREFERRED_LENDER = _family_endpoint("SetPreferredLender", http_method="POST")
+_UNDELETE_FAMILY_GROUP = _family_endpoint("UndeleteFamilyGroup", http_method="POST")
+
+
 class FamilyAPI(BaseAPI):
     """Steam Family API endpoints.
 
@@ -39,23 +92,11 @@ class FamilyAPI(BaseAPI):
             params["steamid_to_cancel"] = str(steamid_to_cancel)
 
         try:
-            response_data = await self._request(
-                interface="IFamilyGroupsService",
-                method="CancelFamilyGroupInvite",
-                version="v1",
-                params=params,
-                auth_type="access_token",
-                http_method="POST",
-            )
-            return response_data
-        except ValueError as e:
-            if "Access token is required" in str(e):
-                raise AuthenticationError(
-                    "Access token is required for Family API endpoints"
-                ) from e
+            return await self._request_ep(_CANCEL_FAMILY_GROUP_INVITE, params)
+        except SteamAPIError:
             raise
         except Exception as e:
-            logger.error(f"Error getting change log: {e}")
+            logger.error("Error getting change log: %s", e)
             raise SteamAPIError(f"Failed to get change log: {e}") from e
 
     async def clear_cooldown_skip(
@@ -77,23 +118,11 @@ class FamilyAPI(BaseAPI):
             params["invite_id"] = str(invite_id)
 
         try:
-            response_data = await self._request(
-                interface="IFamilyGroupsService",
-                method="ClearCooldownSkip",
-                version="v1",
-                params=params,
-                auth_type="access_token",
-                http_method="POST",
-            )
-            return response_data
-        except ValueError as e:
-            if "Access token is required" in str(e):
-                raise AuthenticationError(
-                    "Access token is required for Family API endpoints"
-                ) from e
+            return await self._request_ep(_CLEAR_COOLDOWN_SKIP, params)
+        except SteamAPIError:
             raise
         except Exception as e:
-            logger.error(f"Error getting change log: {e}")
+            logger.error("Error getting change log: %s", e)
             raise SteamAPIError(f"Failed to get change log: {e}") from e
 
     async def confirm_invite_to_family_group(
@@ -121,23 +150,11 @@ class FamilyAPI(BaseAPI):
             params["nonce"] = str(nonce)
 
         try:
-            response_data = await self._request(
-                interface="IFamilyGroupsService",
-                method="ConfirmInviteToFamilyGroup",
-                version="v1",
-                params=params,
-                auth_type="access_token",
-                http_method="POST",
-            )
-            return response_data
-        except ValueError as e:
-            if "Access token is required" in str(e):
-                raise AuthenticationError(
-                    "Access token is required for Family API endpoints"
-                ) from e
+            return await self._request_ep(_CONFIRM_INVITE_TO_FAMILY_GROUP, params)
+        except SteamAPIError:
             raise
         except Exception as e:
-            logger.error(f"Error getting change log: {e}")
+            logger.error("Error getting change log: %s", e)
             raise SteamAPIError(f"Failed to get change log: {e}") from e
 
     async def confirm_join_family_group(
@@ -165,23 +182,11 @@ class FamilyAPI(BaseAPI):
             params["nonce"] = str(nonce)
 
         try:
-            response_data = await self._request(
-                interface="IFamilyGroupsService",
-                method="ConfirmJoinFamilyGroup",
-                version="v1",
-                params=params,
-                auth_type="access_token",
-                http_method="POST",
-            )
-            return response_data
-        except ValueError as e:
-            if "Access token is required" in str(e):
-                raise AuthenticationError(
-                    "Access token is required for Family API endpoints"
-                ) from e
+            return await self._request_ep(_CONFIRM_JOIN_FAMILY_GROUP, params)
+        except SteamAPIError:
             raise
         except Exception as e:
-            logger.error(f"Error getting change log: {e}")
+            logger.error("Error getting change log: %s", e)
             raise SteamAPIError(f"Failed to get change log: {e}") from e
 
     async def create_family_group(self, name: str, steamid: int | None = None):
@@ -202,23 +207,11 @@ class FamilyAPI(BaseAPI):
             params["steamid"] = str(steamid)
 
         try:
-            response_data = await self._request(
-                interface="IFamilyGroupsService",
-                method="CreateFamilyGroup",
-                version="v1",
-                params=params,
-                auth_type="access_token",
-                http_method="POST",
-            )
-            return response_data
-        except ValueError as e:
-            if "Access token is required" in str(e):
-                raise AuthenticationError(
-                    "Access token is required for Family API endpoints"
-                ) from e
+            return await self._request_ep(_CREATE_FAMILY_GROUP, params)
+        except SteamAPIError:
             raise
         except Exception as e:
-            logger.error(f"Error getting change log: {e}")
+            logger.error("Error getting change log: %s", e)
             raise SteamAPIError(f"Failed to get change log: {e}") from e
 
     async def delete_family_group(
@@ -233,28 +226,16 @@ class FamilyAPI(BaseAPI):
         Returns:
 
         """
-        params = {}
-        if family_groupid:
-            params["family_groupid"] = str(family_groupid)
+        params = (
+            {"family_groupid": str(family_groupid)} if family_groupid else _EMPTY_PARAMS
+        )
 
         try:
-            response_data = await self._request(
-                interface="IFamilyGroupsService",
-                method="DeleteFamilyGroup",
-                version="v1",
-                params=params,
-                auth_type="access_token",
-                http_method="POST",
-            )
-            return response_data
-        except ValueError as e:
-            if "Access token is required" in str(e):
-                raise AuthenticationError(
-                    "Access token is required for Family API endpoints"
-                ) from e
+            return await self._request_ep(_DELETE_FAMILY_GROUP, params)
+        except SteamAPIError:
             raise
         except Exception as e:
-            logger.error(f"Error getting change log: {e}")
+            logger.error("Error getting change log: %s", e)
             raise SteamAPIError(f"Failed to get change log: {e}") from e
 
     async def force_accept_invite(
@@ -278,23 +259,11 @@ class FamilyAPI(BaseAPI):
             params["steamid"] = str(steamid)
 
         try:
-            response_data = await self._request(
-                interface="IFamilyGroupsService",
-                method="ForceAcceptInvite",
-                version="v1",
-                params=params,
-                auth_type="access_token",
-                http_method="POST",
-            )
-            return response_data
-        except ValueError as e:
-            if "Access token is required" in str(e):
-                raise AuthenticationError(
-                    "Access token is required for Family API endpoints"
-                ) from e
+            return await self._request_ep(_FORCE_ACCEPT_INVITE, params)
+        except SteamAPIError:
             raise
         except Exception as e:
-            logger.error(f"Error getting change log: {e}")
+            logger.error("Error getting change log: %s", e)
             raise SteamAPIError(f"Failed to get change log: {e}") from e
 
     async def get_change_log(self, family_groupid: int | None = None):
@@ -308,27 +277,16 @@ class FamilyAPI(BaseAPI):
         Returns:
 
         """
-        params = {}
-        if family_groupid:
-            params["family_groupid"] = str(family_groupid)
+        params = (
+            {"family_groupid": str(family_groupid)} if family_groupid else _EMPTY_PARAMS
+        )
 
         try:
-            response_data = await self._request(
-                interface="IFamilyGroupsService",
-                method="GetChangeLog",
-                version="v1",
-                params=params,
-                auth_type="access_token",
-            )
-            return response_data
-        except ValueError as e:
-            if "Access token is required" in str(e):
-                raise AuthenticationError(
-                    "Access token is required for Family API endpoints"
-                ) from e
+            return await self._request_ep(_GET_CHANGE_LOG, params)
+        except SteamAPIError:
             raise
         except Exception as e:
-            logger.error(f"Error getting change log: {e}")
+            logger.error("Error getting change log: %s", e)
             raise SteamAPIError(f"Failed to get change log: {e}") from e
 
     async def get_family_group(
@@ -351,29 +309,29 @@ class FamilyAPI(BaseAPI):
             AuthenticationError: If access token is not provided
             SteamAPIError: On API errors
         """
-        params = {}
-        if family_groupid:
-            params["family_groupid"] = str(family_groupid)
-        if send_running_apps:
-            params["send_running_apps"] = "1"
+        if not family_groupid and not send_running_apps:
+            params = _EMPTY_PARAMS
+        else:
+            params = {}
+            if family_groupid:
+                params["family_groupid"] = str(family_groupid)
+            if send_running_apps:
+                params["send_running_apps"] = "1"
 
         try:
-            response_data = await self._request(
-                interface="IFamilyGroupsService",
-                method="GetFamilyGroup",
-                version="v1",
-                params=params,
-                auth_type="access_token",
+            # Running apps change constantly, so they are never cached
+            response_data = await self._cached_request_ep(
+                0 if send_running_apps else self.client.settings.FAMILY_GROUP_TTL,
+                dict,
+                _GET_FAMILY_GROUP,
+                params,
             )
-            return response_data
-        except ValueError as e:
-            if "Access token is required" in str(e):
-                raise AuthenticationError(
-                    "Access token is required for Family API endpoints"
-                ) from e
+            # The cached dict is shared, so every caller gets its own copy to mutate
+            return copy.deepcopy(response_data)
+        except SteamAPIError:
             raise
         except Exception as e:
-            logger.error(f"Error getting family group: {e}")
+            logger.error("Error getting family group: %s", e)
             raise SteamAPIError(f"Failed to get family group: {e}") from e
 
     async def get_family_group_for_user(
@@ -394,29 +352,68 @@ class FamilyAPI(BaseAPI):
             AuthenticationError: If access token is not provided
             SteamAPIError: On API errors
         """
-        params = {}
-        if steamid is not None:
-            params["steamid"] = str(steamid)
+        params = _EMPTY_PARAMS if steamid is None else {"steamid": str(steamid)}
 
         try:
-            response_data = await self._request(
-                interface="IFamilyGroupsService",
-                method="GetFamilyGroupForUser",
-                version="v1",
-                params=params,
-                auth_type="access_token",
+            return await self._cached_request_ep(
+                self.client.settings.FAMILY_GROUP_TTL,
+                FamilyGroupStatusResponse,
+                _GET_FAMILY_GROUP_FOR_USER,
+                params,
             )
-            return FamilyGroupStatusResponse.model_validate(response_data)
-        except ValueError as e:
-            if "Access token is required" in str(e):
-                raise AuthenticationError(
-                    "Access token is required for Family API endpoints"
-                ) from e
+        except SteamAPIError:
             raise
         except Exception as e:
-            logger.error(f"Error getting family group for user: {e}")
+            logger.error("Error getting family group for user: %s", e)
             raise SteamAPIError(f"Failed to get family group for user: {e}") from e
 
+    async def get_family_overview(
+        self, family_groupid: int | None = None
+    ) -> dict[str, Any]:
+        """Get a family group together with the user's membership and playtimes.
+
+        Independent requests are sent concurrently, so this takes about as long
+        as the slowest of them rather than their sum. Without *family_groupid*
+        the user's current family group is looked up first.
+
+        Other combinations of endpoints can be fetched the same way:
+
+            group, apps = await asyncio.gather(
+                steam.family.get_family_group(family_groupid),
+                steam.family.get_shared_library_apps(family_groupid),
+            )
+
+        Args:
+            family_groupid: Family group id (default: user's current family group)
+
+        Returns:
+            Dictionary with "group" (family group data), "user_group" (family
+            group of the user) and "playtime" (playtime summary). "group" and
+            "playtime" are None if the user is not a member of any family group.
+
+        Raises:
+            AuthenticationError: If access token is not provided
+            SteamAPIError: On API errors
+        """
+        if family_groupid is None:
+            user_group = await self.get_family_group_for_user()
+            if user_group.response.is_not_member_of_any_group:
+                return {"group": None, "user_group": user_group, "playtime": None}
+
+            family_groupid = int(user_group.response.family_groupid)
+            group, playtime = await asyncio.gather(
+                self.get_family_group(family_groupid),
+                self.get_playtime_summary(family_groupid),
+            )
+        else:
+            group, user_group, playtime = await asyncio.gather(
+                self.get_family_group(family_groupid),
+                self.get_family_group_for_user(),
+                self.get_playtime_summary(family_groupid),
+            )
+
+        return {"group": group, "user_group": user_group, "playtime": playtime}
+
     async def get_invite_check_results(
         self, family_groupid: int | None = None, steamid: int | None = None
     ):
@@ -436,25 +433,16 @@ class FamilyAPI(BaseAPI):
             params["steamid"] = str(steamid)
 
         try:
-            response_data = await self._request(
-                interface="IFamilyGroupsService",
-                method="GetInviteCheckResults",
-                version="v1",
-                params=params,
-                auth_type="access_token",
-            )
-            return response_data
-        except ValueError as e:
-            if "Access token is required" in str(e):
-                raise AuthenticationError(
-                    "Access token is required for Family API endpoints"
-                ) from e
+            return await self._request_ep(_GET_INVITE_CHECK_RESULTS, params)
+        except SteamAPIError:
             raise
         except Exception as e:
-            logger.error(f"Error getting invite check results: {e}")
+            logger.error("Error getting invite check results: %s", e)
             raise SteamAPIError(f"Failed to get invite check results: {e}") from e
 
-    async def get_playtime_summary(self, family_groupid: int) -> SteamResponse:
+    async def get_playtime_summary(
+        self, family_groupid: int
+    ) -> PlaytimeSummaryResponse:
         """Get the playtimes in all apps from the shared library
          for the whole family group.
 
@@ -473,23 +461,17 @@ class FamilyAPI(BaseAPI):
             params["family_groupid"] = family_groupid
 
         try:
-            response_data = await self._request(
-                interface="IFamilyGroupsService",
-                method="GetPlaytimeSummary",
-                version="v1",
-                params=params,
-                auth_type="access_token",
-                http_method="POST",
+            # Read-only despite being served over POST
+            return await self._cached_request_ep(
+                self.client.settings.PLAYTIME_SUMMARY_TTL,
+                PlaytimeSummaryResponse,
+                _GET_PLAYTIME_SUMMARY,
+                params,
             )
-            return SteamResponse.model_validate(response_data)
-        except ValueError as e:
-            if "Access token is required" in str(e):
-                raise AuthenticationError(
-                    "Access token is required for Family API endpoints"
-                ) from e
+        except SteamAPIError:
             raise
         except Exception as e:
-            logger.error(f"Error getting playtime summary: {e}")
+            logger.error("Error getting playtime summary: %s", e)
             raise SteamAPIError(f"Failed to get playtime summary: {e}") from e
 
     async def get_preferred_lenders(self, family_groupid: int | None = None):
@@ -501,27 +483,18 @@ class FamilyAPI(BaseAPI):
         Returns:
 
         """
-        params = {}
-        if family_groupid is not None:
-            params["family_groupid"] = str(family_groupid)
+        params = (
+            _EMPTY_PARAMS
+            if family_groupid is None
+            else {"family_groupid": str(family_groupid)}
+        )
 
         try:
-            response_data = await self._request(
-                interface="IFamilyGroupsService",
-                method="GetPreferredLenders",
-                version="v1",
-                params=params,
-                auth_type="access_token",
-            )
-            return response_data
-        except ValueError as e:
-            if "Access token is required" in str(e):
-                raise AuthenticationError(
-                    "Access token is required for Family API endpoints"
-                ) from e
+            return await self._request_ep(_GET_PREFERRED_LENDERS, params)
+        except SteamAPIError:
             raise
         except Exception as e:
-            logger.error(f"Error getting preferred lenders: {e}")
+            logger.error("Error getting preferred lenders: %s", e)
             raise SteamAPIError(f"Failed to get preferred lenders: {e}") from e
 
     async def get_purchase_requests(
@@ -553,22 +526,11 @@ class FamilyAPI(BaseAPI):
             params["rt_include_completed_since"] = str(rt_include_completed_since)
 
         try:
-            response_data = await self._request(
-                interface="IFamilyGroupsService",
-                method="GetPurchaseRequests",
-                version="v1",
-                params=params,
-                auth_type="access_token",
-            )
-            return response_data
-        except ValueError as e:
-            if "Access token is required" in str(e):
-                raise AuthenticationError(
-                    "Access token is required for Family API endpoints"
-                ) from e
+            return await self._request_ep(_GET_PURCHASE_REQUESTS, params)
+        except SteamAPIError:
             raise
         except Exception as e:
-            logger.error(f"Error getting purchase requests: {e}")
+            logger.error("Error getting purchase requests: %s", e)
             raise SteamAPIError(f"Failed to get purchase requests: {e}") from e
 
     async def get_shared_library_apps(
@@ -620,22 +582,16 @@ class FamilyAPI(BaseAPI):
             params["steamid"] = str(steamid)
 
         try:
-            response_data = await self._request(
-                interface="IFamilyGroupsService",
-                method="GetSharedLibraryApps",
-                version="v1",
-                params=params,
-                auth_type="access_token",
+            return await self._cached_request_ep(
+                self.client.settings.SHARED_LIBRARY_APPS_TTL,
+                SharedLibraryAppsResponse,
+                _GET_SHARED_LIBRARY_APPS,
+                params,
             )
-            return SharedLibraryAppsResponse.model_validate(response_data)
-        except ValueError as e:
-            if "Access token is required" in str(e):
-                raise AuthenticationError(
-                    "Access token is required for Family API endpoints"
-                ) from e
+        except SteamAPIError:
             raise
         except Exception as e:
-            logger.error(f"Error getting shared library apps: {e}")
+            logger.error("Error getting shared library apps: %s", e)
             raise SteamAPIError(f"Failed to get shared library apps: {e}") from e
 
     async def get_users_sharing_device(
@@ -663,22 +619,11 @@ class FamilyAPI(BaseAPI):
             params["client_instance_id"] = str(client_instance_id)
 
         try:
-            response_data = await self._request(
-                interface="IFamilyGroupsService",
-                method="GetUsersSharingDevice",
-                version="v1",
-                params=params,
-                auth_type="access_token",
-            )
-            return response_data
-        except ValueError as e:
-            if "Access token is required" in str(e):
-                raise AuthenticationError(
-                    "Access token is required for Family API endpoints"
-                ) from e
+            return await self._request_ep(_GET_USERS_SHARING_DEVICE, params)
+        except SteamAPIError:
             raise
         except Exception as e:
-            logger.error(f"Error getting users sharing device: {e}")
+            logger.error("Error getting users sharing device: %s", e)
             raise SteamAPIError(f"Failed to get users sharing device: {e}") from e
 
     async def invite_to_family_group(
@@ -706,23 +651,11 @@ class FamilyAPI(BaseAPI):
             params["receiver_role"] = str(receiver_role)
 
         try:
-            response_data = await self._request(
-                interface="IFamilyGroupsService",
-                method="InviteToFamilyGroup",
-                version="v1",
-                params=params,
-                auth_type="access_token",
-                http_method="POST",
-            )
-            return response_data
-        except ValueError as e:
-            if "Access token is required" in str(e):
-                raise AuthenticationError(
-                    "Access token is required for Family API endpoints"
-                ) from e
+            return await self._request_ep(_INVITE_TO_FAMILY_GROUP, params)
+        except SteamAPIError:
             raise
         except Exception as e:
-            logger.error(f"Error joining to family group: {e}")
+            logger.error("Error joining to family group: %s", e)
             raise SteamAPIError(f"Failed to join to family group: {e}") from e
 
     async def join_family_group(
@@ -744,23 +677,11 @@ class FamilyAPI(BaseAPI):
             params["nonce"] = str(nonce)
 
         try:
-            response_data = await self._request(
-                interface="IFamilyGroupsService",
-                method="JoinFamilyGroup",
-                version="v1",
-                params=params,
-                auth_type="access_token",
-                http_method="POST",
-            )
-            return response_data
-        except ValueError as e:
-            if "Access token is required" in str(e):
-                raise AuthenticationError(
-                    "Access token is required for Family API endpoints"
-                ) from e
+            return await self._request_ep(_JOIN_FAMILY_GROUP, params)
+        except SteamAPIError:
             raise
         except Exception as e:
-            logger.error(f"Error getting invite to family group: {e}")
+            logger.error("Error getting invite to family group: %s", e)
             raise SteamAPIError(f"Failed to get invite to family group: {e}") from e
 
     async def modify_family_group_details(
@@ -782,23 +703,11 @@ class FamilyAPI(BaseAPI):
             params["name"] = name
 
         try:
-            response_data = await self._request(
-                interface="IFamilyGroupsService",
-                method="ModifyFamilyGroupDetails",
-                version="v1",
-                params=params,
-                auth_type="access_token",
-                http_method="POST",
-            )
-            return response_data
-        except ValueError as e:
-            if "Access token is required" in str(e):
-                raise AuthenticationError(
-                    "Access token is required for Family API endpoints"
-                ) from e
+            return await self._request_ep(_MODIFY_FAMILY_GROUP_DETAILS, params)
+        except SteamAPIError:
             raise
         except Exception as e:
-            logger.error(f"Error to remove from family group: {e}")
+            logger.error("Error to remove from family group: %s", e)
             raise SteamAPIError(f"Failed to remove from family group: {e}") from e
 
     async def remove_from_family_group(
@@ -820,23 +729,11 @@ class FamilyAPI(BaseAPI):
             params["steamid_to_remove"] = str(steamid_to_remove)
 
         try:
-            response_data = await self._request(
-                interface="IFamilyGroupsService",
-                method="RemoveFromFamilyGroup",
-                version="v1",
-                params=params,
-                auth_type="access_token",
-                http_method="POST",
-            )
-            return response_data
-        except ValueError as e:
-            if "Access token is required" in str(e):
-                raise AuthenticationError(
-                    "Access token is required for Family API endpoints"
-                ) from e
+            return await self._request_ep(_REMOVE_FROM_FAMILY_GROUP, params)
+        except SteamAPIError:
             raise
         except Exception as e:
-            logger.error(f"Error to remove from family group: {e}")
+            logger.error("Error to remove from family group: %s", e)
             raise SteamAPIError(f"Failed to remove from family group: {e}") from e
 
     async def request_purchase(
@@ -868,23 +765,11 @@ class FamilyAPI(BaseAPI):
             params["use_account_cart"] = int(use_account_cart)
 
         try:
-            response_data = await self._request(
-                interface="IFamilyGroupsService",
-                method="RequestPurchase",
-                version="v1",
-                params=params,
-                auth_type="access_token",
-                http_method="POST",
-            )
-            return response_data
-        except ValueError as e:
-            if "Access token is required" in str(e):
-                raise AuthenticationError(
-                    "Access token is required for Family API endpoints"
-                ) from e
+            return await self._request_ep(_REQUEST_PURCHASE, params)
+        except SteamAPIError:
             raise
         except Exception as e:
-            logger.error(f"Error to request purchase: {e}")
+            logger.error("Error to request purchase: %s", e)
             raise SteamAPIError(f"Failed to request purchase: {e}") from e
 
     async def resend_invitation_to_family_group(
@@ -908,23 +793,11 @@ class FamilyAPI(BaseAPI):
             params["steamid"] = str(steamid)
 
         try:
-            response_data = await self._request(
-                interface="IFamilyGroupsService",
-                method="RespondToRequestedPurchase",
-                version="v1",
-                params=params,
-                auth_type="access_token",
-                http_method="POST",
-            )
-            return response_data
-        except ValueError as e:
-            if "Access token is required" in str(e):
-                raise AuthenticationError(
-                    "Access token is required for Family API endpoints"
-                ) from e
+            return await self._request_ep(_RESEND_INVITATION_TO_FAMILY_GROUP, params)
+        except SteamAPIError:
             raise
         except Exception as e:
-            logger.error(f"Error to resend invitation to family group: {e}")
+            logger.error("Error to resend invitation to family group: %s", e)
             raise SteamAPIError(
                 f"Failed to resend invitation to family group: {e}"
             ) from e
@@ -958,23 +831,11 @@ class FamilyAPI(BaseAPI):
             params["request_id"] = request_id
 
         try:
-            response_data = await self._request(
-                interface="IFamilyGroupsService",
-                method="RespondToRequestedPurchase",
-                version="v1",
-                params=params,
-                auth_type="access_token",
-                http_method="POST",
-            )
-            return response_data
-        except ValueError as e:
-            if "Access token is required" in str(e):
-                raise AuthenticationError(
-                    "Access token is required for Family API endpoints"
-                ) from e
+            return await self._request_ep(_RESPOND_TO_REQUESTED_PURCHASE, params)
+        except SteamAPIError:
             raise
         except Exception as e:
-            logger.error(f"Error to response to requested purchase: {e}")
+            logger.error("Error to response to requested purchase: %s", e)
             raise SteamAPIError(f"Failed to response to requested purchase: {e}") from e
 
     async def rollback_family_group(
@@ -996,23 +857,11 @@ class FamilyAPI(BaseAPI):
             params["rtime32_target"] = str(rtime32_target)
 
         try:
-            response_data = await self._request(
-                interface="IFamilyGroupsService",
-                method="SetFamilyCooldownOverrides",
-                version="v1",
-                params=params,
-                auth_type="access_token",
-                http_method="POST",
-            )
-            return response_data
-        except ValueError as e:
-            if "Access token is required" in str(e):
-                raise AuthenticationError(
-                    "Access token is required for Family API endpoints"
-                ) from e
+            return await self._request_ep(_ROLLBACK_FAMILY_GROUP, params)
+        except SteamAPIError:
             raise
         except Exception as e:
-            logger.error(f"Error to rollback family group: {e}")
+            logger.error("Error to rollback family group: %s", e)
             raise SteamAPIError(f"Failed to rollback family group: {e}") from e
 
     async def set_family_cooldown_overrides(
@@ -1035,23 +884,11 @@ class FamilyAPI(BaseAPI):
             params["cooldown_count"] = str(cooldown_count)
 
         try:
-            response_data = await self._request(
-                interface="IFamilyGroupsService",
-                method="SetFamilyCooldownOverrides",
-                version="v1",
-                params=params,
-                auth_type="access_token",
-                http_method="POST",
-            )
-            return response_data
-        except ValueError as e:
-            if "Access token is required" in str(e):
-                raise AuthenticationError(
-                    "Access token is required for Family API endpoints"
-                ) from e
+            return await self._request_ep(_SET_FAMILY_COOLDOWN_OVERRIDES, params)
+        except SteamAPIError:
             raise
         except Exception as e:
-            logger.error(f"Error to set family cooldown overrides: {e}")
+            logger.error("Error to set family cooldown overrides: %s", e)
             raise SteamAPIError(f"Failed to set family cooldown overrides: {e}") from e
 
     async def set_preferred_lender(
@@ -1079,23 +916,11 @@ class FamilyAPI(BaseAPI):
             params["lender_steamid"] = str(lender_steamid)
 
         try:
-            response_data = await self._request(
-                interface="IFamilyGroupsService",
-                method="SetPreferredLender",
-                version="v1",
-                params=params,
-                auth_type="access_token",
-                http_method="POST",
-            )
-            return response_data
-        except ValueError as e:
-            if "Access token is required" in str(e):
-                raise AuthenticationError(
-                    "Access token is required for Family API endpoints"
-                ) from e
+            return await self._request_ep(_SET_PREFERRED_LENDER, params)
+        except SteamAPIError:
             raise
         except Exception as e:
-            logger.error(f"Error getting invite to family group: {e}")
+            logger.error("Error getting invite to family group: %s", e)
             raise SteamAPIError(f"Failed to get invite to family group: {e}") from e
 
     async def undelete_family_group(self, family_groupid: int | None = None):
@@ -1107,26 +932,16 @@ class FamilyAPI(BaseAPI):
         Returns:
 
         """
-        params = {}
-        if family_groupid is not None:
-            params["family_groupid"] = str(family_groupid)
+        params = (
+            _EMPTY_PARAMS
+            if family_groupid is None
+            else {"family_groupid": str(family_groupid)}
+        )
 
         try:
-            response_data = await self._request(
-                interface="IFamilyGroupsService",
-                method="UndeleteFamilyGroup",
-                version="v1",
-                params=params,
-                auth_type="access_token",
-                http_method="POST",
-            )
-            return response_data
-        except ValueError as e:
-            if "Access token is required" in str(e):
-                raise AuthenticationError(
-                    "Access token is required for Family API endpoints"
-                ) from e
+            return await self._request_ep(_UNDELETE_FAMILY_GROUP, params)
+        except SteamAPIError:
             raise
         except Exception as e:
-            logger.error(f"Error to undelete family group: {e}")
+            logger.error("Error to undelete family group: %s", e)
             raise SteamAPIError(f"Failed to undelete family group: {e}") from e
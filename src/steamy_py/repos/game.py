@@ -84,7 +84,7 @@ class GameAPI(BaseAPI):
         except PrivateProfileError:
             raise
         except Exception as e:
-            logger.error(f"Error getting owned games for {steamid}: {e}")
+            logger.error("Error getting owned games for %s: %s", steamid, e)
             if isinstance(e, SteamAPIError):
                 raise
             raise SteamAPIError(f"Failed to get owned games: {e}") from e
@@ -110,7 +110,7 @@ class GameAPI(BaseAPI):
             return response_obj.applist.apps
 
         except Exception as e:
-            logger.error(f"Error getting app list: {e}")
+            logger.error("Error getting app list: %s", e)
             if isinstance(e, SteamAPIError):
                 raise
             raise SteamAPIError(f"Failed to get app list: {e}") from e
@@ -167,7 +167,9 @@ class GameAPI(BaseAPI):
         except (PrivateProfileError, GameNotFoundError):
             raise
         except Exception as e:
-            logger.error(f"Error getting achievements for {steamid}, app {app_id}: {e}")
+            logger.error(
+                "Error getting achievements for %s, app %s: %s", steamid, app_id, e
+            )
             if isinstance(e, SteamAPIError):
                 raise
             raise SteamAPIError(f"Failed to get player achievements: {e}") from e
@@ -211,7 +213,7 @@ class GameAPI(BaseAPI):
         except GameNotFoundError:
             raise
         except Exception as e:
-            logger.error(f"Error getting schema for app {app_id}: {e}")
+            logger.error("Error getting schema for app %s: %s", app_id, e)
             if isinstance(e, SteamAPIError):
                 raise
             raise SteamAPIError(f"Failed to get game schema: {e}") from e
@@ -248,7 +250,7 @@ class GameAPI(BaseAPI):
             return AppDetails(**app_data["data"])
 
         except Exception as e:
-            logger.error(f"Error getting app details for {app_id}: {e}")
+            logger.error("Error getting app details for %s: %s", app_id, e)
             if isinstance(e, SteamAPIError):
                 raise
             raise SteamAPIError(f"Failed to get app details: {e}") from e
@@ -1,6 +1,9 @@
 """Player/User API endpoints for Steam API."""
 
+import asyncio
 import logging
+import re
+from collections.abc import AsyncIterator
 from typing import Union
 
 from ..exceptions import (
@@ -21,6 +24,12 @@ from .base import BaseAPI
 
 logger = logging.getLogger(__name__)
 
+# Steam rejects batch endpoints with more Steam IDs than this
+MAX_STEAM_IDS_PER_REQUEST = 100
+
+# 17-digit SteamID64 of an individual account
+_STEAM_ID_RE = re.compile(r"7656119[0-9]{10}")
+
 
 class PlayerAPI(BaseAPI):
     """Steam Player/User API endpoints."""
@@ -30,8 +39,11 @@ class PlayerAPI(BaseAPI):
     ) -> list[PlayerSummary]:
         """Get player summary information for one or more Steam IDs.
 
+        Duplicate Steam IDs are dropped, and lists longer than 100 IDs are split
+        into batches that are requested concurrently.
+
         Args:
-            steam_ids: Single Steam ID or list of Steam IDs (max 100)
+            steam_ids: Single Steam ID or list of Steam IDs
 
         Returns:
             List of player summaries
@@ -40,38 +52,110 @@ class PlayerAPI(BaseAPI):
             InvalidSteamIDError: If Steam ID format is invalid
             SteamAPIError: On API errors
         """
-        if isinstance(steam_ids, str):
-            steam_ids = [steam_ids]
+        batches = self._validated_batches(steam_ids)
 
-        if len(steam_ids) > 100:
-            raise ValueError("Maximum 100 Steam IDs allowed per request")
+        try:
+            results = await asyncio.gather(
+                *(self._fetch_player_summaries(batch) for batch in batches)
+            )
+            return [player for result in results for player in result]
 
-        # Validate Steam IDs
-        for steamid in steam_ids:
-            self._validate_steam_id(steamid)
+        except Exception as e:
+            logger.error("Error getting player summaries: %s", e)
+            if isinstance(e, SteamAPIError):
+                raise
+            raise SteamAPIError(f"Failed to get player summaries: {e}")
 
-        steamids_param = ",".join(steam_ids)
+    async def iter_player_summaries(
+        self, steam_ids: Union[str, list[str]]
+    ) -> AsyncIterator[PlayerSummary]:
+        """Iterate over player summaries as soon as each batch arrives.
 
-        try:
-            response_data = await self._request(
-                interface="ISteamUser",
-                method="GetPlayerSummaries",
-                version="v2",
-                params={"steamids": steamids_param},
-            )
+        Streaming variant of *get_player_summaries*: batches of 100 IDs are
+        requested concurrently and their players are yielded in completion order,
+        so the first results are available before the slowest batch returns.
 
-            # Parse the nested response structure
-            if "response" not in response_data:
-                raise SteamAPIError("Invalid response structure from Steam API")
+        Args:
+            steam_ids: Single Steam ID or list of Steam IDs
 
-            response_obj = PlayerSummariesResponse(**response_data["response"])
-            return response_obj.players
+        Yields:
+            Player summaries
+
+        Raises:
+            InvalidSteamIDError: If Steam ID format is invalid
+            SteamAPIError: On API errors
+        """
+        tasks = [
+            asyncio.ensure_future(self._fetch_player_summaries(batch))
+            for batch in self._validated_batches(steam_ids)
+        ]
+        try:
+            for next_batch in asyncio.as_completed(tasks):
+                for player in await next_batch:
+                    yield player
 
         except Exception as e:
-            logger.error(f"Error getting player summaries: {e}")
+            logger.error("Error getting player summaries: %s", e)
             if isinstance(e, SteamAPIError):
                 raise
-            raise SteamAPIError(f"Failed to get player summaries: {e}")
+            raise SteamAPIError(f"Failed to get player summaries: {e}") from e
+        finally:
+            # Stop remaining batches if the caller stops iterating early
+            for task in tasks:
+                task.cancel()
+
+    def _validated_batches(self, steam_ids: Union[str, list[str]]) -> list[str]:
+        """Deduplicate, validate and join Steam IDs into batch parameters.
+
+        Validation and deduplication share a single pass, which stops at the
+        first invalid ID before any batch is built.
+
+        Args:
+            steam_ids: Single Steam ID or list of Steam IDs
+
+        Returns:
+            Comma-separated unique Steam IDs in their original order, at most
+            100 per batch
+
+        Raises:
+            InvalidSteamIDError: If Steam ID format is invalid
+        """
+        if isinstance(steam_ids, str):
+            steam_ids = [steam_ids]
+
+        # Only rejected IDs take the slow path that explains the error
+        match = _STEAM_ID_RE.fullmatch
+        unique: dict[str, None] = {}
+        for steamid in steam_ids:
+            if steamid not in unique:
+                if not match(steamid):
+                    self._validate_steam_id(steamid)
+                unique[steamid] = None
+
+        ids = list(unique)
+        size = MAX_STEAM_IDS_PER_REQUEST
+        return [",".join(ids[i : i + size]) for i in range(0, len(ids), size)]
+
+    async def _fetch_player_summaries(self, steamids: str) -> list[PlayerSummary]:
+        """Request summaries for a single batch of validated Steam IDs."""
+        return await self._cached_request(
+            self.client.settings.PLAYER_SUMMARIES_TTL,
+            self._parse_player_summaries,
+            interface="ISteamUser",
+            method="GetPlayerSummaries",
+            version="v2",
+            params={"steamids": steamids},
+        )
+
+    @staticmethod
+    def _parse_player_summaries(response_data: dict) -> list[PlayerSummary]:
+        """Parse GetPlayerSummaries response into player summaries."""
+        # Parse the nested response structure
+        if "response" not in response_data:
+            raise SteamAPIError("Invalid response structure from Steam API")
+
+        response_obj = PlayerSummariesResponse(**response_data["response"])
+        return response_obj.players
 
     async def get_friends_list(
         self, steamid: str, relationship: str = "friend"
@@ -91,6 +175,48 @@ class PlayerAPI(BaseAPI):
             PlayerNotFoundError: If player not found
             SteamAPIError: On API errors
         """
+        entries = await self._fetch_friend_entries(steamid, relationship)
+
+        try:
+            return FriendsListResponse(friends=entries).friends
+        except Exception as e:
+            logger.error("Error getting friends list for %s: %s", steamid, e)
+            raise SteamAPIError(f"Failed to get friends list: {e}") from e
+
+    async def iter_friends_list(
+        self, steamid: str, relationship: str = "friend"
+    ) -> AsyncIterator[Friend]:
+        """Iterate over the friends list of a Steam user.
+
+        Streaming variant of *get_friends_list*: each friend is validated only
+        when the iteration reaches it, so the first friend is available right
+        after the response is decoded and large friends lists are never held as
+        models all at once.
+
+        Args:
+            steamid: Steam ID of the user
+            relationship: Relationship type (default: "friend")
+
+        Yields:
+            Friends
+
+        Raises:
+            InvalidSteamIDError: If Steam ID format is invalid
+            PrivateProfileError: If profile is private
+            SteamAPIError: On API errors
+        """
+        for entry in await self._fetch_friend_entries(steamid, relationship):
+            try:
+                friend = Friend.model_validate(entry)
+            except Exception as e:
+                logger.error("Error getting friends list for %s: %s", steamid, e)
+                raise SteamAPIError(f"Failed to get friends list: {e}") from e
+            yield friend
+
+    async def _fetch_friend_entries(
+        self, steamid: str, relationship: str
+    ) -> list[dict]:
+        """Request the raw friend entries of a Steam user."""
         self._validate_steam_id(steamid)
 
         try:
@@ -105,15 +231,12 @@ class PlayerAPI(BaseAPI):
                 # This usually means the profile is private
                 raise PrivateProfileError(steamid)
 
-            response_obj = FriendsListResponse(
-                friends=response_data["friendslist"].get("friends", [])
-            )
-            return response_obj.friends
+            return response_data["friendslist"].get("friends", [])
 
         except PrivateProfileError:
             raise
         except Exception as e:
-            logger.error(f"Error getting friends list for {steamid}: {e}")
+            logger.error("Error getting friends list for %s: %s", steamid, e)
             if isinstance(e, SteamAPIError):
                 raise
             raise SteamAPIError(f"Failed to get friends list: {e}")
@@ -123,8 +246,11 @@ class PlayerAPI(BaseAPI):
     ) -> list[PlayerBan]:
         """Get ban information for one or more Steam users.
 
+        Duplicate Steam IDs are dropped, and lists longer than 100 IDs are split
+        into batches that are requested concurrently.
+
         Args:
-            steam_ids: Single Steam ID or list of Steam IDs (max 100)
+            steam_ids: Single Steam ID or list of Steam IDs
 
         Returns:
             List of player ban information
@@ -133,38 +259,32 @@ class PlayerAPI(BaseAPI):
             InvalidSteamIDError: If Steam ID format is invalid
             SteamAPIError: On API errors
         """
-        if isinstance(steam_ids, str):
-            steam_ids = [steam_ids]
-
-        if len(steam_ids) > 100:
-            raise ValueError("Maximum 100 Steam IDs allowed per request")
-
-        # Validate Steam IDs
-        for steamid in steam_ids:
-            self._validate_steam_id(steamid)
-
-        steamids_param = ",".join(steam_ids)
+        batches = self._validated_batches(steam_ids)
 
         try:
-            response_data = await self._request(
-                interface="ISteamUser",
-                method="GetPlayerBans",
-                version="v1",
-                params={"steamids": steamids_param},
+            results = await asyncio.gather(
+                *(self._fetch_player_bans(batch) for batch in batches)
             )
-
-            if "players" not in response_data:
-                raise SteamAPIError("Invalid response structure from Steam API")
-
-            response_obj = PlayerBansResponse(players=response_data["players"])
-            return response_obj.players
+            return [ban for result in results for ban in result]
 
         except Exception as e:
-            logger.error(f"Error getting player bans: {e}")
+            logger.error("Error getting player bans: %s", e)
             if isinstance(e, SteamAPIError):
                 raise
             raise SteamAPIError(f"Failed to get player bans: {e}")
 
+    async def _fetch_player_bans(self, steamids: str) -> list[PlayerBan]:
+        """Request bans for a single batch of validated Steam IDs."""
+        response_obj = await self._cached_request(
+            self.client.settings.PLAYER_BANS_TTL,
+            PlayerBansResponse,
+            interface="ISteamUser",
+            method="GetPlayerBans",
+            version="v1",
+            params={"steamids": steamids},
+        )
+        return response_obj.players
+
     async def resolve_vanity_url(
         self, vanity_url: str, url_type: int = 1
     ) -> str | None:
@@ -180,30 +300,27 @@ class PlayerAPI(BaseAPI):
         Raises:
             SteamAPIError: On API errors
         """
-        # Clean the vanity URL (remove full URL parts if provided)
+        # Clean the vanity URL (remove full URL parts and trailing slash if provided)
         if "/" in vanity_url:
-            vanity_url = vanity_url.split("/")[-1]
+            vanity_url = vanity_url.rstrip("/").rpartition("/")[2]
 
         try:
-            response_data = await self._request(
+            response_obj = await self._cached_request(
+                self.client.settings.RESOLVE_VANITY_URL_TTL,
+                ResolveVanityURLResponse,
                 interface="ISteamUser",
                 method="ResolveVanityURL",
                 version="v1",
                 params={"vanityurl": vanity_url, "url_type": url_type},
             )
 
-            if "response" not in response_data:
-                raise SteamAPIError("Invalid response structure from Steam API")
-
-            response_obj = ResolveVanityURLResponse(response=response_data["response"])
-
             if response_obj.response.is_success:
                 return response_obj.response.steamid
             else:
                 return None
 
         except Exception as e:
-            logger.error(f"Error resolving vanity URL '{vanity_url}': {e}")
+            logger.error("Error resolving vanity URL '%s': %s", vanity_url, e)
             if isinstance(e, SteamAPIError):
                 raise
             raise SteamAPIError(f"Failed to resolve vanity URL: {e}")
@@ -217,6 +334,11 @@ class PlayerAPI(BaseAPI):
         Raises:
             InvalidSteamIDError: If Steam ID format is invalid
         """
+        # Valid IDs pass with a single match; the checks below only explain why
+        # an ID was rejected
+        if _STEAM_ID_RE.fullmatch(steamid):
+            return
+
         if not steamid:
             raise InvalidSteamIDError(steamid, "Steam ID cannot be empty")
 
@@ -227,8 +349,9 @@ class PlayerAPI(BaseAPI):
         if len(steamid) != 17:
             raise InvalidSteamIDError(steamid, "Steam ID must be 17 digits long")
 
-        if not steamid.startswith("7656119"):
-            raise InvalidSteamIDError(steamid, "Invalid Steam ID format")
+        # Also covers IDs passing the checks above, such as non-ASCII digits,
+        # so only the regex can accept an ID
+        raise InvalidSteamIDError(steamid, "Invalid Steam ID format")
 
     async def get_player_summary(self, steamid: str) -> PlayerSummary | None:
         """Get single player summary (convenience method).
@@ -243,5 +366,15 @@ class PlayerAPI(BaseAPI):
             InvalidSteamIDError: If Steam ID format is invalid
             SteamAPIError: On API errors
         """
-        summaries = await self.get_player_summaries(steamid)
+        self._validate_steam_id(steamid)
+
+        # A single ID is already a valid batch parameter, so skip batching
+        try:
+            summaries = await self._fetch_player_summaries(steamid)
+        except Exception as e:
+            logger.error("Error getting player summary for %s: %s", steamid, e)
+            if isinstance(e, SteamAPIError):
+                raise
+            raise SteamAPIError(f"Failed to get player summary: {e}") from e
+
         return summaries[0] if summaries else None
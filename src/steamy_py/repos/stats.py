@@ -94,7 +94,7 @@ class StatsAPI(BaseAPI):
         except GameNotFoundError:
             raise
         except Exception as e:
-            logger.error(f"Error getting global stats for app {app_id}: {e}")
+            logger.error("Error getting global stats for app %s: %s", app_id, e)
             if isinstance(e, SteamAPIError):
                 raise
             raise SteamAPIError(f"Failed to get global stats: {e}")
@@ -152,7 +152,9 @@ class StatsAPI(BaseAPI):
         except (PrivateProfileError, GameNotFoundError):
             raise
         except Exception as e:
-            logger.error(f"Error getting user stats for {steamid}, app {app_id}: {e}")
+            logger.error(
+                "Error getting user stats for %s, app %s: %s", steamid, app_id, e
+            )
             if isinstance(e, SteamAPIError):
                 raise
             raise SteamAPIError(f"Failed to get user stats: {e}")
@@ -194,7 +196,9 @@ class StatsAPI(BaseAPI):
         except GameNotFoundError:
             raise
         except Exception as e:
-            logger.error(f"Error getting achievement percentages for app {app_id}: {e}")
+            logger.error(
+                "Error getting achievement percentages for app %s: %s", app_id, e
+            )
             if isinstance(e, SteamAPIError):
                 raise
             raise SteamAPIError(f"Failed to get achievement percentages: {e}")
@@ -238,7 +242,7 @@ class StatsAPI(BaseAPI):
         except GameNotFoundError:
             raise
         except Exception as e:
-            logger.error(f"Error getting current players for app {app_id}: {e}")
+            logger.error("Error getting current players for app %s: %s", app_id, e)
             if isinstance(e, SteamAPIError):
                 raise
             raise SteamAPIError(f"Failed to get current players: {e}")
@@ -284,7 +288,7 @@ class StatsAPI(BaseAPI):
             return response_obj.to_news_items()
 
         except Exception as e:
-            logger.error(f"Error getting news for app {app_id}: {e}")
+            logger.error("Error getting news for app %s: %s", app_id, e)
             if isinstance(e, SteamAPIError):
                 raise
             raise SteamAPIError(f"Failed to get news: {e}")
@@ -1,9 +1,10 @@
 """Main Steam Web API wrapper class."""
 
 import logging
+from typing import TYPE_CHECKING
 
-from .client import Client
-from .config import Settings
+from .cache import ResponseCache
+from .client import Client, TokenProvider
 from .exceptions import ConfigurationError
 from .repos.family import FamilyAPI
 from .repos.game import GameAPI
@@ -11,6 +12,9 @@ from .repos.market import MarketAPI
 from .repos.player import PlayerAPI
 from .repos.stats import StatsAPI
 
+if TYPE_CHECKING:
+    from .config import Settings
+
 logger = logging.getLogger(__name__)
 
 
@@ -48,7 +52,9 @@ class Steam:
         self,
         api_key: str | None = None,
         access_token: str | None = None,
-        settings: Settings | None = None,
+        settings: "Settings | None" = None,
+        cache: ResponseCache | None = None,
+        token_provider: TokenProvider | None = None,
         **kwargs,
     ):
         """Initialize the Steam API client.
@@ -57,6 +63,10 @@ class Steam:
             api_key: Steam API key for public endpoints. If not provided, will try to get from STEAM_API_KEY env var
             access_token: Steam access token for user-specific endpoints. If not provided, will try to get from STEAM_ACCESS_TOKEN env var
             settings: Optional settings configuration
+            cache: Optional response cache for parsed responses
+            token_provider: Optional function or coroutine function returning a new
+                access token, used to refresh it in the background shortly before
+                it expires. Plain functions run in a worker thread.
             **kwargs: Additional arguments passed to Settings
 
         Raises:
@@ -78,7 +88,7 @@ class Steam:
 
             access_token = os.getenv("STEAM_ACCESS_TOKEN")
 
-        if not api_key and not access_token:
+        if not api_key and not access_token and token_provider is None:
             raise ConfigurationError(
                 "Either Steam API key or access token is required. "
                 "API key: Get from https://steamcommunity.com/dev/apikey (set STEAM_API_KEY env var) "
@@ -87,11 +97,17 @@ class Steam:
 
         # Initialize settings
         if settings is None:
-            settings = Settings(**kwargs)
+            from .config import Settings, get_settings
+
+            settings = Settings(**kwargs) if kwargs else get_settings()
 
         # Initialize HTTP client
         self.client = Client(
-            api_key=api_key, access_token=access_token, settings=settings
+            api_key=api_key,
+            access_token=access_token,
+            settings=settings,
+            cache=cache,
+            token_provider=token_provider,
         )
 
         # Initialize API repositories
@@ -149,7 +165,7 @@ class Steam:
             return True
 
         except Exception as e:
-            logger.error(f"Steam API connection test failed: {e}")
+            logger.error("Steam API connection test failed: %s", e)
             return False
 
     async def get_api_key_info(self) -> dict: